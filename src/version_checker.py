@@ -6,22 +6,112 @@ files and creates GitHub issues if a new version is available.
 Requirements:
 - Python 3.6+
 - requests: pip install requests
+- orjson:   pip install orjson
+- packaging: pip install packaging
 - PyYAML:   pip install pyyaml
+            (built against libyaml for the fast C loader, libyaml-dev when
+            installing from source)
 """
 
 import argparse
-import json
+import atexit
+import functools
+import hashlib
+import mmap
 import os
+import re
+import shutil
 import sys
+import tempfile
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
-from typing import Any, Dict, List, Optional, TypedDict
-
+from typing import (
+    IO,
+    Any,
+    Dict,
+    FrozenSet,
+    Iterator,
+    List,
+    Match,
+    Optional,
+    Pattern,
+    Set,
+    Tuple,
+    TypedDict,
+    Union,
+)
+
+import orjson
 import requests
 import yaml
+from packaging.version import InvalidVersion, Version
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader  # type: ignore[assignment]
 
 REPO: Optional[str] = os.getenv("GITHUB_REPOSITORY")
 API_URL: str = "https://api.github.com"
 CHARTS_PATH: str = "charts"
+MAX_WORKERS: int = 20
+MAX_ISSUE_WORKERS: int = 5
+INDEX_CHUNK_SIZE: int = 64 * 1024
+REQUIRED_APP_KEYS: FrozenSet[str] = frozenset({"repoURL", "chart", "targetRevision"})
+
+_ENTRIES_RE: Pattern[bytes] = re.compile(rb"^entries:[ \t]*\r?$", re.M)
+_TOP_LEVEL_KEY_RE: Pattern[bytes] = re.compile(rb"^[^\s#]", re.M)
+_FIRST_ENTRY_RE: Pattern[bytes] = re.compile(rb"\r?\n( *)- ")
+_VERSION_RE: Pattern[bytes] = re.compile(
+    rb"version:[ \t]*(?P<quote>[\"']?)(?P<version>[^\s\"'#]+)(?P=quote)[ \t]*\r?$",
+    re.M,
+)
+_SEMVER_RE: Pattern[str] = re.compile(
+    r"^v?(\d+)\.(\d+)\.(\d+)"
+    r"(?:-(?P<prerelease>[0-9A-Za-z-]+(?:\.[0-9A-Za-z-]+)*))?"
+    r"(?:\+[0-9A-Za-z-]+(?:\.[0-9A-Za-z-]+)*)?$",
+)
+_RELEASE_RE: Pattern[str] = re.compile(r"^v?(\d+(?:\.\d+)*)")
+# Resolved lazily by _index_cache_dir(), so the home directory is only
+# needed when the default cache directory is actually used
+CACHE_DIR: Optional[Path] = (
+    Path(os.environ["HELM_VERSION_CHECKER_CACHE_DIR"])
+    if os.getenv("HELM_VERSION_CHECKER_CACHE_DIR")
+    else None
+)
+
+_index_locks: Dict[str, threading.Lock] = {}
+_index_cache_dir_lock: threading.Lock = threading.Lock()
+_issue_search_cache: Dict[Tuple[str, str], Optional[int]] = {}
+_maintainers_cache: Dict[str, Tuple[str, Dict[str, List[str]]]] = {}
+
+
+def _build_session() -> requests.Session:
+    """Creates the HTTP session shared by all requests, keeping connections
+    alive between calls and retrying rate-limited or failed requests.
+    """
+    retries: Retry = Retry(
+        total=5,
+        backoff_factor=0.5,
+        status_forcelist=[429, 500, 502, 503, 504],
+        respect_retry_after_header=True,
+    )
+    # Keep a pool per host for as many repositories as are looked up at once
+    adapter: HTTPAdapter = HTTPAdapter(
+        pool_connections=MAX_WORKERS,
+        pool_maxsize=32,
+        max_retries=retries,
+    )
+    session: requests.Session = requests.Session()
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+SESSION: requests.Session = _build_session()
 
 
 class AppDetails(TypedDict):
@@ -30,25 +120,273 @@ class AppDetails(TypedDict):
     chart: str
 
 
-def get_maintainers(file_path: str, app_group: str) -> List[str]:
-    """Loads maintainers from the YAML file for a specific app group."""
+def load_maintainers(file_path: str) -> Dict[str, List[str]]:
+    """Loads the maintainers of all app groups from the YAML file.
+
+    The file is only parsed again if its content changed since the last call.
+    """
     try:
-        with open(file_path) as f:
-            maintainers_data: Dict[str, List[str]] = yaml.safe_load(f)
-            assignees: List[str] = maintainers_data.get(app_group, [])
-            if not assignees:
-                print(
-                    f"No specific maintainers found for '{app_group}'. Looking for 'default' maintainers.",
-                )
-                assignees = maintainers_data.get("default", [])
-            return assignees
+        with open(file_path, "rb") as f:
+            content: bytes = f.read()
+        sha: str = hashlib.sha256(content).hexdigest()
+        if file_path in _maintainers_cache and _maintainers_cache[file_path][0] == sha:
+            return _maintainers_cache[file_path][1]
+
+        maintainers_data: Dict[str, List[str]] = (
+            yaml.load(content, Loader=SafeLoader) or {}
+        )
+        _maintainers_cache[file_path] = (sha, maintainers_data)
+        return maintainers_data
 
     except FileNotFoundError:
         print(f"Error: Maintainers file not found at {file_path}", file=sys.stderr)
-        return []
+        return {}
     except Exception as e:
         print(f"Error reading or parsing maintainers file: {e}", file=sys.stderr)
-        return []
+        return {}
+
+
+def get_maintainers(
+    maintainers_data: Dict[str, List[str]],
+    app_group: str,
+) -> List[str]:
+    """Returns the maintainers of a specific app group, falling back to the
+    'default' maintainers.
+    """
+    assignees: List[str] = maintainers_data.get(app_group, [])
+    if not assignees:
+        print(
+            f"No specific maintainers found for '{app_group}'. Looking for 'default' maintainers.",
+        )
+        assignees = maintainers_data.get("default", [])
+    return assignees
+
+
+def _skip_node(events: Iterator[yaml.Event], event: yaml.Event) -> None:
+    """Consumes the rest of the YAML node that starts with event."""
+    depth: int = 0
+    while True:
+        if isinstance(event, yaml.CollectionStartEvent):
+            depth += 1
+        elif isinstance(event, yaml.CollectionEndEvent):
+            depth -= 1
+        if depth == 0:
+            return
+        event = next(events)
+
+
+def _find_mapping_value(events: Iterator[yaml.Event], key: str) -> yaml.Event:
+    """Advances through the current mapping until key and returns the first
+    event of its value. Raises KeyError if the mapping has no such key.
+    """
+    while True:
+        event: yaml.Event = next(events)
+        if isinstance(event, yaml.MappingEndEvent):
+            raise KeyError(key)
+        found: bool = isinstance(event, yaml.ScalarEvent) and event.value == key
+        _skip_node(events, event)
+        value: yaml.Event = next(events)
+        if found:
+            return value
+        _skip_node(events, value)
+
+
+def _find_latest_version(index: Union[bytes, IO[bytes]], chart_name: str) -> str:
+    """Returns the version of the first, i.e. newest, entry of a chart in an
+    index.yaml.
+
+    Walks the YAML event stream instead of loading the whole document, so
+    nothing is built for the other charts and parsing stops at the version.
+    """
+    events: Iterator[yaml.Event] = yaml.parse(index, Loader=SafeLoader)
+    event: yaml.Event = next(events)
+    while isinstance(event, (yaml.StreamStartEvent, yaml.DocumentStartEvent)):
+        event = next(events)
+
+    for key in ("entries", chart_name):
+        if not isinstance(event, yaml.MappingStartEvent):
+            raise TypeError(f"expected a mapping around '{key}'")
+        event = _find_mapping_value(events, key)
+
+    if not isinstance(event, yaml.SequenceStartEvent):
+        raise TypeError(f"expected a list of entries for '{chart_name}'")
+    event = next(events)
+    if isinstance(event, yaml.SequenceEndEvent):
+        raise IndexError(f"no entries for '{chart_name}'")
+    if not isinstance(event, yaml.MappingStartEvent):
+        raise TypeError(f"expected a mapping as entry of '{chart_name}'")
+
+    event = _find_mapping_value(events, "version")
+    if not isinstance(event, yaml.ScalarEvent):
+        raise TypeError(f"expected a scalar version for '{chart_name}'")
+    return event.value
+
+
+def _scan_latest_version(
+    index: Union[bytes, mmap.mmap],
+    chart_name: str,
+) -> Optional[str]:
+    """Finds the version of a chart's first entry with regular expressions.
+
+    This relies on the block layout `helm repo index` writes, with charts
+    indented by two spaces under 'entries'. Returns None whenever the index
+    doesn't look like that, so that the caller can parse it properly instead.
+    """
+    entries: Optional[Match[bytes]] = _ENTRIES_RE.search(index)
+    if not entries:
+        return None
+    next_top_level_key: Optional[Match[bytes]] = _TOP_LEVEL_KEY_RE.search(
+        index,
+        entries.end(),
+    )
+    end: int = next_top_level_key.start() if next_top_level_key else len(index)
+
+    chart: Optional[Match[bytes]] = re.compile(
+        rb"^  " + re.escape(chart_name.encode()) + rb":[ \t]*\r?$",
+        re.M,
+    ).search(index, entries.end(), end)
+    if not chart:
+        return None
+    first_entry: Optional[Match[bytes]] = _FIRST_ENTRY_RE.match(index, chart.end())
+    if not first_entry:
+        return None
+
+    # The version is either the key on the dash line itself or a line indented
+    # like the entry's other keys. A line indented no further than the dash
+    # ends the first entry.
+    version: Optional[Match[bytes]] = _VERSION_RE.match(index, first_entry.end())
+    if not version:
+        dash_indent: int = len(first_entry.group(1))
+        version = re.compile(
+            rb"^(?: {%d}" % (dash_indent + 2)
+            + _VERSION_RE.pattern
+            + rb"| {0,%d}\S)" % dash_indent,
+            re.M,
+        ).search(index, first_entry.end(), end)
+    if not version or not version.group("version"):
+        return None
+    return version.group("version").decode()
+
+
+def _read_latest_version(index_file: Path, chart_name: str) -> str:
+    """Returns the newest version of a chart from a downloaded index.yaml.
+
+    Scans the memory-mapped file with regular expressions first and only
+    falls back to the YAML event stream for layouts the scan doesn't know.
+    """
+    with open(index_file, "rb") as f:
+        if os.fstat(f.fileno()).st_size:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as index:
+                latest_version: Optional[str] = _scan_latest_version(
+                    index,
+                    chart_name,
+                )
+            if latest_version is not None:
+                return latest_version
+        return _find_latest_version(f, chart_name)
+
+
+@functools.lru_cache(maxsize=None)
+def _temporary_index_dir() -> Path:
+    """Creates a directory for index downloads that is removed at exit."""
+    temporary_dir: Path = Path(tempfile.mkdtemp(prefix="helm-version-checker-"))
+    atexit.register(shutil.rmtree, temporary_dir, ignore_errors=True)
+    return temporary_dir
+
+
+@functools.lru_cache(maxsize=None)
+def _resolve_index_cache_dir() -> Path:
+    """Returns the directory indexes are downloaded to: CACHE_DIR if it is
+    writable, otherwise a temporary directory that isn't kept across runs.
+    """
+    try:
+        cache_dir: Path = CACHE_DIR or (
+            Path(os.getenv("XDG_CACHE_HOME") or Path.home() / ".cache")
+            / "helm-version-checker"
+        )
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        if not os.access(cache_dir, os.W_OK):
+            raise PermissionError(f"{cache_dir} is not writable")
+        return cache_dir
+    except (OSError, RuntimeError, KeyError) as e:
+        print(
+            f"Warning: Could not use the index cache directory, indexes won't be cached across runs. Details: {e}",
+            file=sys.stderr,
+        )
+        return _temporary_index_dir()
+
+
+def _index_cache_dir() -> Path:
+    """Thread-safe wrapper around _resolve_index_cache_dir(), so the warning
+    is printed and the temporary directory created at most once.
+    """
+    with _index_cache_dir_lock:
+        return _resolve_index_cache_dir()
+
+
+def _store_index(cache_file: Path, response: requests.Response) -> Path:
+    """Streams a downloaded index.yaml into the cache, together with its
+    validators so the next run can send a conditional request.
+    """
+    index_file: Path = cache_file.with_suffix(".yaml")
+    metadata_file: Path = cache_file.with_suffix(".json")
+    cache_file.parent.mkdir(parents=True, exist_ok=True)
+    # The validators of a previous download don't describe the new content
+    metadata_file.unlink(missing_ok=True)
+
+    tmp_file: Path = cache_file.with_suffix(".yaml.tmp")
+    with open(tmp_file, "wb") as f:
+        for chunk in response.iter_content(chunk_size=INDEX_CHUNK_SIZE):
+            f.write(chunk)
+    os.replace(tmp_file, index_file)
+
+    etag: Optional[str] = response.headers.get("ETag")
+    last_modified: Optional[str] = response.headers.get("Last-Modified")
+    if etag or last_modified:
+        metadata: Dict[str, Optional[str]] = {
+            "url": response.url,
+            "etag": etag,
+            "last_modified": last_modified,
+        }
+        tmp_file = cache_file.with_suffix(".json.tmp")
+        tmp_file.write_bytes(orjson.dumps(metadata))
+        os.replace(tmp_file, metadata_file)
+    return index_file
+
+
+@functools.lru_cache(maxsize=None)
+def _load_index(index_url: str) -> Path:
+    """Downloads a Helm repository's index.yaml into the cache directory and
+    returns the path of the downloaded file.
+
+    The download is streamed to disk, so an index never has to be held in
+    memory. The result is memoised until the next run of main(), so charts
+    sharing a repository only download the index once. Across runs the index
+    is revalidated with its ETag / Last-Modified headers, so an unchanged index
+    is not downloaded again.
+    """
+    cache_file: Path = (
+        _index_cache_dir() / hashlib.sha256(index_url.encode()).hexdigest()
+    )
+    index_file: Path = cache_file.with_suffix(".yaml")
+    headers: Dict[str, str] = {}
+    if index_file.is_file():
+        try:
+            metadata: Dict[str, Optional[str]] = orjson.loads(
+                cache_file.with_suffix(".json").read_bytes(),
+            )
+            if metadata.get("etag"):
+                headers["If-None-Match"] = metadata["etag"]
+            if metadata.get("last_modified"):
+                headers["If-Modified-Since"] = metadata["last_modified"]
+        except (OSError, ValueError):
+            pass
+
+    with SESSION.get(index_url, headers=headers, stream=True, timeout=10) as response:
+        response.raise_for_status()
+        if response.status_code == 304:
+            return index_file
+        return _store_index(cache_file, response)
 
 
 def get_latest_helm_version(repo_url: Optional[str], chart_name: str) -> Optional[str]:
@@ -62,17 +400,23 @@ def get_latest_helm_version(repo_url: Optional[str], chart_name: str) -> Optiona
 
     index_url: str = f"{repo_url.rstrip('/')}/index.yaml"
     try:
-        response: requests.Response = requests.get(index_url, timeout=10)
-        response.raise_for_status()
-        index_data: Any = yaml.safe_load(response.content)
-        latest_version: str = index_data["entries"][chart_name][0]["version"]
+        # Lookups run concurrently; hold a per-index lock so that only the
+        # first one downloads the index and the others wait for the cache.
+        with _index_locks.setdefault(index_url, threading.Lock()):
+            index_file: Path = _load_index(index_url)
+        latest_version: str = _read_latest_version(index_file, chart_name)
         return latest_version
     except requests.exceptions.RequestException as e:
         print(
             f"Error: Failed to download index.yaml from {index_url}. Details: {e}",
             file=sys.stderr,
         )
-    except (KeyError, IndexError, TypeError) as e:
+    except OSError as e:
+        print(
+            f"Error: Could not store index.yaml from {index_url}. Details: {e}",
+            file=sys.stderr,
+        )
+    except (KeyError, IndexError, TypeError, yaml.YAMLError) as e:
         print(
             f"Error: Could not parse version for chart '{chart_name}' from {index_url}. Details: {e}",
             file=sys.stderr,
@@ -80,9 +424,69 @@ def get_latest_helm_version(repo_url: Optional[str], chart_name: str) -> Optiona
     return None
 
 
-def check_existing_issue(repo: str, token: str, title: str) -> Optional[int]:
-    """Checks if a GitHub issue with the exact same title already exists,
-    handling pagination and providing debug output.
+def _semver_key(version: str) -> Optional[Tuple[Any, ...]]:
+    """Returns a sort key following SemVer precedence, or None if version is
+    not a SemVer version.
+    """
+    match: Optional[Match[str]] = _SEMVER_RE.match(version)
+    if not match:
+        return None
+    release: Tuple[int, ...] = tuple(int(part) for part in match.group(1, 2, 3))
+    if match.group("prerelease") is None:
+        # A release ranks above all of its pre-releases
+        return (release, 1, ())
+    prerelease: Tuple[Tuple[int, Any], ...] = tuple(
+        (0, int(identifier)) if identifier.isdigit() else (1, identifier)
+        for identifier in match.group("prerelease").split(".")
+    )
+    return (release, 0, prerelease)
+
+
+def _release_key(version: str) -> Optional[Tuple[int, ...]]:
+    """Returns the leading numeric release of version without trailing zeros,
+    so '1.2' and '1.2.0' compare equal, or None if it has none.
+    """
+    match: Optional[Match[str]] = _RELEASE_RE.match(version)
+    if not match:
+        return None
+    release: List[int] = [int(part) for part in match.group(1).split(".")]
+    while len(release) > 1 and release[-1] == 0:
+        release.pop()
+    return tuple(release)
+
+
+def is_newer_version(latest_version: str, current_version: str) -> bool:
+    """Checks if latest_version is newer than current_version.
+
+    Helm chart versions are SemVer, optionally prefixed with 'v', and are
+    compared by SemVer precedence. Other versions are compared as PEP 440
+    versions, except those with a '-', which PEP 440 would read as a
+    post-release. Those are only compared by their numeric release, as the
+    suffix may mark either a pre-release or a later build. Anything else
+    falls back to a plain string comparison.
+    """
+    latest_key: Optional[Tuple[Any, ...]] = _semver_key(latest_version)
+    current_key: Optional[Tuple[Any, ...]] = _semver_key(current_version)
+    if latest_key is not None and current_key is not None:
+        return latest_key > current_key
+    if "-" in latest_version or "-" in current_version:
+        latest_release: Optional[Tuple[int, ...]] = _release_key(latest_version)
+        current_release: Optional[Tuple[int, ...]] = _release_key(current_version)
+        if latest_release is not None and current_release is not None:
+            return latest_release > current_release
+        return latest_version != current_version
+
+    try:
+        latest: Version = Version(latest_version)
+        current: Version = Version(current_version)
+    except InvalidVersion:
+        return latest_version != current_version
+    return latest > current
+
+
+def load_open_issue_titles(repo: str, token: str) -> Optional[Dict[str, int]]:
+    """Loads the titles and numbers of all open GitHub issues, handling
+    pagination. Returns None if the issues could not be listed.
     """
     headers: Dict[str, str] = {
         "Authorization": f"token {token}",
@@ -91,38 +495,90 @@ def check_existing_issue(repo: str, token: str, title: str) -> Optional[int]:
     params: Dict[str, Any] = {"state": "open", "per_page": 100}
     url: Optional[str] = f"{API_URL}/repos/{repo}/issues"
 
-    page_num: int = 1
+    open_issues: Dict[str, int] = {}
     while url:
         try:
-            response: requests.Response = requests.get(
+            response: requests.Response = SESSION.get(
                 url,
                 headers=headers,
                 params=params,
                 timeout=10,
             )
             response.raise_for_status()
-            issues: List[Dict[str, Any]] = response.json()
-
-            for issue in issues:
-                if issue.get("title") == title:
-                    return issue.get("number")
-
-            if "next" in response.links:
-                url = response.links["next"]["url"]
-                params = {}
-                page_num += 1
-            else:
-                url = None
-
+            issues: List[Dict[str, Any]] = orjson.loads(response.content)
         except requests.exceptions.RequestException as e:
-            error_details = e.response.text if e.response else str(e)
+            error_details = e.response.text if e.response is not None else str(e)
             print(
-                f"Error checking for existing GitHub issues: {error_details}",
+                f"Error listing open GitHub issues: {error_details}",
                 file=sys.stderr,
             )
             return None
+        except orjson.JSONDecodeError as e:
+            print(f"Error listing open GitHub issues: {e}", file=sys.stderr)
+            return None
 
-    return None
+        for issue in issues:
+            open_issues.setdefault(issue["title"], issue["number"])
+
+        if "next" in response.links:
+            url = response.links["next"]["url"]
+            params = {}
+        else:
+            url = None
+
+    return open_issues
+
+
+def check_existing_issue(repo: str, token: str, title: str) -> Optional[int]:
+    """Checks if an open GitHub issue with the exact same title already exists.
+
+    Uses a single Search API query instead of paging through every open issue.
+    The search API only allows 30 requests per minute, so answers are cached
+    for the rest of the run.
+    """
+    if (repo, title) in _issue_search_cache:
+        return _issue_search_cache[(repo, title)]
+
+    headers: Dict[str, str] = {
+        "Authorization": f"token {token}",
+        "Accept": "application/vnd.github.v3+json",
+    }
+    params: Dict[str, Any] = {
+        "q": f'repo:{repo} is:issue is:open in:title "{title}"',
+        "per_page": 100,
+    }
+    try:
+        response: requests.Response = SESSION.get(
+            f"{API_URL}/search/issues",
+            headers=headers,
+            params=params,
+            timeout=10,
+        )
+        response.raise_for_status()
+        issues: List[Dict[str, Any]] = orjson.loads(response.content).get(
+            "items",
+            [],
+        )
+    except requests.exceptions.RequestException as e:
+        error_details = e.response.text if e.response is not None else str(e)
+        print(
+            f"Error checking for existing GitHub issues: {error_details}",
+            file=sys.stderr,
+        )
+        return None
+    except orjson.JSONDecodeError as e:
+        print(f"Error checking for existing GitHub issues: {e}", file=sys.stderr)
+        return None
+
+    # "in:title" also matches titles that merely contain the search terms
+    issue_number: Optional[int] = None
+    for issue in issues:
+        if issue.get("title") == title:
+            issue_number = issue.get("number")
+            break
+
+    _issue_search_cache[(repo, title)] = issue_number
+    return issue_number
 
 
 def create_github_issue(
@@ -136,6 +592,7 @@ def create_github_issue(
     headers: Dict[str, str] = {
         "Authorization": f"token {token}",
         "Accept": "application/vnd.github.v3+json",
+        "Content-Type": "application/json",
     }
     payload: Dict[str, Any] = {
         "title": title,
@@ -144,10 +601,10 @@ def create_github_issue(
     }
     issues_url: str = f"{API_URL}/repos/{repo}/issues"
     try:
-        response: requests.Response = requests.post(
+        response: requests.Response = SESSION.post(
             issues_url,
             headers=headers,
-            data=json.dumps(payload),
+            data=orjson.dumps(payload),
             timeout=10,
         )
         response.raise_for_status()
@@ -167,6 +624,26 @@ def create_github_issue(
         )
 
 
+def find_values_files(charts_dir_path: str) -> Iterator[Path]:
+    """Yields the values.yaml file of every app group directory, using the
+    file types cached by os.scandir instead of a stat call per entry.
+    """
+    try:
+        with os.scandir(charts_dir_path) as entries:
+            for entry in entries:
+                if entry.is_dir():
+                    values_file: Path = Path(entry.path) / "values.yaml"
+                    if values_file.is_file():
+                        yield values_file
+    except (FileNotFoundError, NotADirectoryError):
+        return
+    except OSError as e:
+        print(
+            f"Warning: Could not read charts directory '{charts_dir_path}'. Details: {e}",
+            file=sys.stderr,
+        )
+
+
 def parse_args() -> argparse.Namespace:
     """Parses command-line arguments."""
     parser = argparse.ArgumentParser(description="Helm Version Checker")
@@ -205,99 +682,153 @@ def main() -> None:
 
     print(f"Running on repository: {REPO}")
 
-    values_files: List[Path] = list(Path(charts_dir_path).glob("*/values.yaml"))
-    if not values_files:
-        print(
-            f"No 'values.yaml' files found in subdirectories of '{charts_dir_path}'. Exiting.",
-        )
-        return
+    # Index downloads and issue searches are only memoised for one run, so a
+    # process calling main() repeatedly still sees new versions and issues.
+    _load_index.cache_clear()
+    _issue_search_cache.clear()
 
-    for value_file in values_files:
-        print(f"\n--- Processing file: {value_file} ---")
-        app_group: str = value_file.parent.name
+    maintainers_data: Dict[str, List[str]] = load_maintainers(maintainers_file_path)
 
-        try:
-            with open(value_file) as f:
-                apps_data: Optional[Dict[str, AppDetails]] = yaml.safe_load(f)
-        except Exception as e:
-            print(
-                f"Error reading or parsing YAML file {value_file}: {e}",
-                file=sys.stderr,
-            )
-            continue
-
-        if not apps_data:
-            continue
+    open_issues: Optional[Dict[str, int]] = load_open_issue_titles(
+        REPO,
+        github_token,
+    )
+    if open_issues is None:
+        print(
+            "Falling back to searching for existing issues one by one.",
+            file=sys.stderr,
+        )
 
-        for name, details in apps_data.items():
-            if not isinstance(details, dict):  # type: ignore
+    charts: List[Tuple[Path, str, str, str, Tuple[Optional[str], str]]] = []
+    lookups: Dict[Tuple[Optional[str], str], "Future[Optional[str]]"] = {}
+    found_values_file: bool = False
+    # Index lookups are independent network round-trips. Submit each one as
+    # soon as its chart is found, so downloads overlap with reading the
+    # remaining values files, and only wait for the results when reporting.
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        for value_file in find_values_files(charts_dir_path):
+            found_values_file = True
+            print(f"\n--- Processing file: {value_file} ---")
+            app_group: str = value_file.parent.name
+
+            try:
+                with open(value_file) as f:
+                    apps_data: Optional[Dict[str, AppDetails]] = yaml.load(
+                        f,
+                        Loader=SafeLoader,
+                    )
+            except Exception as e:
                 print(
-                    f"Warning: Skipping '{name}' in {value_file} because its value is not a dictionary.",
+                    f"Error reading or parsing YAML file {value_file}: {e}",
                     file=sys.stderr,
                 )
                 continue
 
-            required_keys = {"repoURL", "chart", "targetRevision"}
-            if not required_keys.issubset(details.keys()):
-                missing_keys = required_keys - details.keys()
-                print(
-                    f"Warning: Skipping '{name}' in {value_file} due to missing keys: {', '.join(missing_keys)}",
-                    file=sys.stderr,
-                )
+            if not apps_data:
                 continue
 
-            repo_url: Optional[str] = details.get("repoURL")
-            target_revision: str = str(details.get("targetRevision", ""))
-            chart: Optional[str] = details.get("chart")
+            for name, details in apps_data.items():
+                if not isinstance(details, dict):  # type: ignore
+                    print(
+                        f"Warning: Skipping '{name}' in {value_file} because its value is not a dictionary.",
+                        file=sys.stderr,
+                    )
+                    continue
+
+                if not REQUIRED_APP_KEYS.issubset(details.keys()):
+                    missing_keys = REQUIRED_APP_KEYS - details.keys()
+                    print(
+                        f"Warning: Skipping '{name}' in {value_file} due to missing keys: {', '.join(missing_keys)}",
+                        file=sys.stderr,
+                    )
+                    continue
+
+                lookup: Tuple[Optional[str], str] = (
+                    details["repoURL"],
+                    details["chart"],
+                )
+                target_revision: str = str(details["targetRevision"])
+                charts.append((value_file, app_group, name, target_revision, lookup))
 
-            latest_version: Optional[str] = get_latest_helm_version(repo_url, chart)
+                if lookup not in lookups:
+                    lookups[lookup] = executor.submit(
+                        get_latest_helm_version,
+                        *lookup,
+                    )
 
-            if not latest_version:
-                continue
+    if not found_values_file:
+        print(
+            f"No 'values.yaml' files found in subdirectories of '{charts_dir_path}'. Exiting.",
+        )
+        return
+
+    new_issues: List[Tuple[str, str, List[str]]] = []
+    new_issue_titles: Set[str] = set()
+    for value_file, app_group, name, target_revision, lookup in charts:
+        latest_version: Optional[str] = lookups[lookup].result()
 
-            print("----------------------------------------")
-            print(f"Checking: {name} (from {app_group})")
-            print(f"  -> Your Version (targetRevision): {target_revision}")
-            print(f"  -> Latest Version Available:      {latest_version}")
-            print("----------------------------------------")
+        if not latest_version:
+            continue
+
+        print("----------------------------------------")
+        print(f"Checking: {name} (from {app_group})")
+        print(f"  -> Your Version (targetRevision): {target_revision}")
+        print(f"  -> Latest Version Available:      {latest_version}")
+        print("----------------------------------------")
 
-            if latest_version != target_revision and target_revision:
-                title: str = f"New Version Available: {name} {latest_version}"
+        if target_revision and is_newer_version(latest_version, target_revision):
+            title: str = f"New Version Available: {name} {latest_version}"
 
-                existing_issue_number: Optional[int] = check_existing_issue(
+            # The same app can be listed in several groups; open one issue.
+            if title in new_issue_titles:
+                print(f"Issue for '{title}' is already being created. Skipping.")
+                continue
+
+            existing_issue_number: Optional[int]
+            if open_issues is not None:
+                existing_issue_number = open_issues.get(title)
+            else:
+                existing_issue_number = check_existing_issue(
                     REPO,
                     github_token,
                     title,
                 )
 
-                if not existing_issue_number:
-                    print(f"Found new version for {name}! Creating issue...")
+            if not existing_issue_number:
+                print(f"Found new version for {name}! Creating issue...")
 
-                    assignees: List[str] = get_maintainers(
-                        maintainers_file_path,
-                        app_group,
-                    )
-
-                    if assignees:
-                        print(
-                            f"Found maintainers for '{app_group}': {', '.join(assignees)}",
-                        )
-
-                    body: str = (
-                        f"New version available for **{name}**!\n\n"
-                        f"Current `targetRevision` set: `{target_revision}`\n"
-                        f"New version available: `{latest_version}`\n\n"
-                        f"Please consider creating a PR to update the `targetRevision` in this file: "
-                        f"[{value_file}](https://github.com/{REPO}/blob/main/{value_file})\n\n"
-                        "Thanks."
-                    )
+                assignees: List[str] = get_maintainers(maintainers_data, app_group)
 
-                    create_github_issue(REPO, github_token, title, body, assignees)
-                else:
+                if assignees:
                     print(
-                        f"Issue #{existing_issue_number} for '{title}' already exists. Skipping.",
+                        f"Found maintainers for '{app_group}': {', '.join(assignees)}",
                     )
 
+                body: str = (
+                    f"New version available for **{name}**!\n\n"
+                    f"Current `targetRevision` set: `{target_revision}`\n"
+                    f"New version available: `{latest_version}`\n\n"
+                    f"Please consider creating a PR to update the `targetRevision` in this file: "
+                    f"[{value_file}](https://github.com/{REPO}/blob/main/{value_file})\n\n"
+                    "Thanks."
+                )
+
+                new_issues.append((title, body, assignees))
+                new_issue_titles.add(title)
+            else:
+                print(
+                    f"Issue #{existing_issue_number} for '{title}' already exists. Skipping.",
+                )
+
+    # Create the issues concurrently, but only a few at a time: GitHub's
+    # secondary rate limits punish bursts of content creation.
+    with ThreadPoolExecutor(max_workers=MAX_ISSUE_WORKERS) as executor:
+        for _ in executor.map(
+            lambda issue: create_github_issue(REPO, github_token, *issue),
+            new_issues,
+        ):
+            pass
+
     print("\nScript finished.")
 
 
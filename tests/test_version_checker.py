@@ -1,4 +1,5 @@
 import argparse
+import importlib.util
 import sys
 from pathlib import Path
 from unittest.mock import MagicMock, patch
@@ -50,6 +51,23 @@ dexK8sAuthenticator:
 """
 
 
+@pytest.fixture(autouse=True)
+def clear_caches(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    """Drops memoised index.yaml downloads, issue searches and maintainers
+    between tests and keeps the on-disk index cache out of the user's home
+    directory."""
+    monkeypatch.setattr(version_checker, "CACHE_DIR", tmp_path / "cache")
+    version_checker._resolve_index_cache_dir.cache_clear()
+    version_checker._load_index.cache_clear()
+    version_checker._issue_search_cache.clear()
+    version_checker._maintainers_cache.clear()
+    yield
+    version_checker._resolve_index_cache_dir.cache_clear()
+    version_checker._load_index.cache_clear()
+    version_checker._issue_search_cache.clear()
+    version_checker._maintainers_cache.clear()
+
+
 @pytest.fixture
 def cert_manager_index() -> str:
     """Mock response for charts.jetstack.io/index.yaml"""
@@ -102,30 +120,86 @@ entries:
 """
 
 
-def test_get_maintainers_specific_group(tmp_path: Path):
-    """Tests loading maintainers for a specific, defined app group."""
+@pytest.mark.skipif(
+    not hasattr(yaml, "CSafeLoader"), reason="PyYAML is built without libyaml"
+)
+def test_safe_loader_falls_back_without_libyaml(monkeypatch):
+    """Tests that the pure-Python SafeLoader is used when libyaml is missing."""
+    # Import a separate copy, so the module under test keeps its state
+    spec = importlib.util.spec_from_file_location(
+        "version_checker_without_libyaml", version_checker.__file__
+    )
+    module = importlib.util.module_from_spec(spec)
+    with monkeypatch.context() as m:
+        m.delattr(yaml, "CSafeLoader")
+        spec.loader.exec_module(module)
+    assert module.SafeLoader is yaml.SafeLoader
+    assert version_checker.SafeLoader is yaml.CSafeLoader
+
+
+def test_session_retries_transient_errors():
+    """Tests that the shared session retries rate limits and server errors."""
+    adapter = version_checker.SESSION.get_adapter("https://api.github.com")
+    assert adapter.max_retries.total == 5
+    assert {429, 502, 503}.issubset(adapter.max_retries.status_forcelist)
+    assert "POST" not in adapter.max_retries.allowed_methods
+    assert adapter._pool_connections >= version_checker.MAX_WORKERS
+
+
+def test_load_maintainers(tmp_path: Path):
+    """Tests loading the maintainers of all app groups."""
     p = tmp_path / "MAINTAINERS.yaml"
     p.write_text(MAINTAINERS_CONTENT)
-    assignees = version_checker.get_maintainers(str(p), "firsttest-apps")
-    assert assignees == ["gh-user2"]
+    maintainers = version_checker.load_maintainers(str(p))
+    assert maintainers == {"default": ["gh-user1"], "firsttest-apps": ["gh-user2"]}
 
 
-def test_get_maintainers_fallback_to_default(tmp_path: Path):
-    """Tests falling back to 'default' when an app group is not specified."""
+def test_load_maintainers_reparses_only_changed_file(tmp_path: Path):
+    """Tests that an unchanged maintainers file is not parsed again."""
     p = tmp_path / "MAINTAINERS.yaml"
     p.write_text(MAINTAINERS_CONTENT)
-    assignees = version_checker.get_maintainers(str(p), "secondtest-apps")
-    assert assignees == ["gh-user1"]
+    with patch("version_checker.yaml.load", wraps=yaml.load) as mock_load:
+        first = version_checker.load_maintainers(str(p))
+        assert version_checker.load_maintainers(str(p)) is first
+        assert mock_load.call_count == 1
 
+        p.write_text("default:\n  - gh-user3\n")
+        assert version_checker.load_maintainers(str(p)) == {"default": ["gh-user3"]}
+        assert mock_load.call_count == 2
 
-def test_get_maintainers_file_not_found(capsys):
-    """Tests that an empty list is returned if the file doesn't exist."""
-    assignees = version_checker.get_maintainers("nonexistent/file.yaml", "any-app")
-    assert assignees == []
+
+def test_load_maintainers_file_not_found(capsys):
+    """Tests that an empty mapping is returned if the file doesn't exist."""
+    maintainers = version_checker.load_maintainers("nonexistent/file.yaml")
+    assert maintainers == {}
     captured = capsys.readouterr()
     assert "Error: Maintainers file not found" in captured.err
 
 
+def test_load_maintainers_parse_error(tmp_path: Path, capsys):
+    """Tests that an empty mapping is returned if the file is not valid YAML."""
+    p = tmp_path / "MAINTAINERS.yaml"
+    p.write_text("default: [gh-user1")
+    maintainers = version_checker.load_maintainers(str(p))
+    assert maintainers == {}
+    captured = capsys.readouterr()
+    assert "Error reading or parsing maintainers file" in captured.err
+
+
+def test_get_maintainers_specific_group():
+    """Tests looking up maintainers for a specific, defined app group."""
+    maintainers = yaml.safe_load(MAINTAINERS_CONTENT)
+    assignees = version_checker.get_maintainers(maintainers, "firsttest-apps")
+    assert assignees == ["gh-user2"]
+
+
+def test_get_maintainers_fallback_to_default():
+    """Tests falling back to 'default' when an app group is not specified."""
+    maintainers = yaml.safe_load(MAINTAINERS_CONTENT)
+    assignees = version_checker.get_maintainers(maintainers, "secondtest-apps")
+    assert assignees == ["gh-user1"]
+
+
 def test_get_latest_helm_version_success(requests_mock, cert_manager_index):
     """Tests a successful fetch of a chart version."""
     url = "https://charts.jetstack.io/index.yaml"
@@ -136,6 +210,211 @@ def test_get_latest_helm_version_success(requests_mock, cert_manager_index):
     assert version == "v1.19.1"
 
 
+MULTI_CHART_INDEX = """
+apiVersion: v1
+entries:
+  argo-cd:
+  - annotations:
+      artifacthub.io/changes: |
+        - kind: fixed
+          description: "version: 0.0.0"
+    urls: [https://example.com/argo-cd-8.6.2.tgz]
+    version: 8.6.2
+  argo-workflows:
+  - {name: argo-workflows, version: "0.45.0"}
+  - {name: argo-workflows, version: "0.44.0"}
+  empty-chart: []
+  broken-chart: not-a-list
+  redis-app:
+  - dependencies:
+    - name: redis
+      version: 17.0.0
+    name: redis-app
+    version: '1.2.0'
+  - name: redis-app
+    version: 1.1.0
+  version-first:
+  - version: 2.0.0
+    name: version-first
+generated: "2025-10-15T09:20:14Z"
+serverInfo:
+  missing-chart:
+  - version: 9.9.9
+"""
+
+
+@pytest.mark.parametrize(
+    "chart_name, expected",
+    [
+        ("argo-cd", "8.6.2"),
+        ("argo-workflows", "0.45.0"),
+        ("redis-app", "1.2.0"),
+        ("version-first", "2.0.0"),
+    ],
+)
+def test_find_latest_version(chart_name, expected):
+    """Tests that the streaming lookup returns the newest entry's version."""
+    version = version_checker._find_latest_version(
+        MULTI_CHART_INDEX.encode(), chart_name
+    )
+    assert version == expected
+    entries = yaml.safe_load(MULTI_CHART_INDEX)["entries"]
+    assert version == str(entries[chart_name][0]["version"])
+
+
+@pytest.mark.parametrize(
+    "chart_name, error",
+    [
+        ("missing-chart", KeyError),
+        ("empty-chart", IndexError),
+        ("broken-chart", TypeError),
+    ],
+)
+def test_find_latest_version_errors(chart_name, error):
+    """Tests that malformed or missing entries raise the same errors as
+    indexing into the loaded document would."""
+    with pytest.raises(error):
+        version_checker._find_latest_version(MULTI_CHART_INDEX.encode(), chart_name)
+
+
+@pytest.mark.parametrize(
+    "chart_name, expected",
+    [
+        ("argo-cd", "8.6.2"),
+        ("redis-app", "1.2.0"),
+        ("version-first", "2.0.0"),
+        # Flow style entries, missing charts and anything else unexpected
+        # are left to the YAML parser
+        ("argo-workflows", None),
+        ("empty-chart", None),
+        ("broken-chart", None),
+        ("missing-chart", None),
+    ],
+)
+def test_scan_latest_version(chart_name, expected):
+    """Tests that the regex scan finds the newest entry's version or gives up."""
+    version = version_checker._scan_latest_version(
+        MULTI_CHART_INDEX.encode(), chart_name
+    )
+    assert version == expected
+
+
+def test_scan_latest_version_without_entries():
+    """Tests that the regex scan gives up on documents without entries."""
+    assert version_checker._scan_latest_version(b"apiVersion: v1\n", "any") is None
+
+
+@pytest.mark.parametrize("index", [MULTI_CHART_INDEX, ""])
+def test_get_latest_helm_version_falls_back_to_parser(requests_mock, index, capsys):
+    """Tests that indexes the regex scan doesn't understand are still parsed."""
+    requests_mock.get("https://charts.example.com/index.yaml", text=index)
+    version = version_checker.get_latest_helm_version(
+        "https://charts.example.com", "argo-workflows"
+    )
+    if index:
+        assert version == "0.45.0"
+    else:
+        assert version is None
+        assert "Error: Could not parse version" in capsys.readouterr().err
+
+
+def test_get_latest_helm_version_index_is_memoised(requests_mock, cert_manager_index):
+    """Tests that an index.yaml is downloaded only once per run."""
+    url = "https://charts.jetstack.io/index.yaml"
+    requests_mock.get(url, text=cert_manager_index)
+    for repo_url in ("https://charts.jetstack.io", "https://charts.jetstack.io/"):
+        version = version_checker.get_latest_helm_version(repo_url, "cert-manager")
+        assert version == "v1.19.1"
+    assert requests_mock.call_count == 1
+
+
+def test_get_latest_helm_version_not_modified(requests_mock, cert_manager_index):
+    """Tests that an unchanged index.yaml is revalidated and read from the cache."""
+    url = "https://charts.jetstack.io/index.yaml"
+    requests_mock.get(
+        url,
+        [
+            {"text": cert_manager_index, "headers": {"ETag": '"abc"'}},
+            {"status_code": 304},
+        ],
+    )
+    version_checker.get_latest_helm_version("https://charts.jetstack.io", "cert-manager")
+    version_checker._load_index.cache_clear()
+
+    version = version_checker.get_latest_helm_version(
+        "https://charts.jetstack.io", "cert-manager"
+    )
+    assert version == "v1.19.1"
+    assert requests_mock.call_count == 2
+    assert requests_mock.last_request.headers["If-None-Match"] == '"abc"'
+
+
+def test_get_latest_helm_version_without_cached_copy(
+    requests_mock, cert_manager_index, tmp_path: Path
+):
+    """Tests that the index is downloaded in full if the cached copy is gone."""
+    url = "https://charts.jetstack.io/index.yaml"
+    requests_mock.get(
+        url,
+        [
+            {"text": cert_manager_index, "headers": {"Last-Modified": "yesterday"}},
+            {"text": cert_manager_index},
+        ],
+    )
+    version_checker.get_latest_helm_version("https://charts.jetstack.io", "cert-manager")
+    version_checker._load_index.cache_clear()
+    for cached in (tmp_path / "cache").glob("*.yaml"):
+        cached.unlink()
+
+    version = version_checker.get_latest_helm_version(
+        "https://charts.jetstack.io", "cert-manager"
+    )
+    assert version == "v1.19.1"
+    assert requests_mock.call_count == 2
+    assert "If-Modified-Since" not in requests_mock.last_request.headers
+    # Without validators the stale metadata must not be reused either
+    assert not list((tmp_path / "cache").glob("*.json"))
+
+
+def test_get_latest_helm_version_cache_not_writable(
+    requests_mock, cert_manager_index, tmp_path: Path, monkeypatch, capsys
+):
+    """Tests that an unusable cache directory falls back to a temporary one."""
+    cache_dir = tmp_path / "not-a-directory"
+    cache_dir.write_text("")
+    monkeypatch.setattr(version_checker, "CACHE_DIR", cache_dir)
+    requests_mock.get("https://charts.jetstack.io/index.yaml", text=cert_manager_index)
+    for chart_name in ("cert-manager", "cert-manager"):
+        version = version_checker.get_latest_helm_version(
+            "https://charts.jetstack.io", chart_name
+        )
+        assert version == "v1.19.1"
+    captured = capsys.readouterr()
+    assert captured.err.count("Warning: Could not use the index cache directory") == 1
+    assert version_checker._index_cache_dir() == version_checker._temporary_index_dir()
+
+
+def test_get_latest_helm_version_without_home_directory(
+    requests_mock, cert_manager_index, monkeypatch, capsys
+):
+    """Tests that the default cache directory is only resolved when needed and
+    that a missing home directory falls back to a temporary one."""
+
+    def no_home():
+        raise RuntimeError("Could not determine home directory.")
+
+    monkeypatch.setattr(version_checker, "CACHE_DIR", None)
+    monkeypatch.delenv("XDG_CACHE_HOME", raising=False)
+    monkeypatch.setattr(Path, "home", no_home)
+    requests_mock.get("https://charts.jetstack.io/index.yaml", text=cert_manager_index)
+    version = version_checker.get_latest_helm_version(
+        "https://charts.jetstack.io", "cert-manager"
+    )
+    assert version == "v1.19.1"
+    captured = capsys.readouterr()
+    assert "Could not determine home directory" in captured.err
+
+
 def test_get_latest_helm_version_http_error(requests_mock, capsys):
     """Tests a 404 error when fetching index.yaml."""
     url = "https://charts.example.com/index.yaml"
@@ -181,37 +460,56 @@ def test_get_latest_helm_version_null_repo_url(url, capsys):
     assert "Warning: Invalid or missing repoURL" in captured.err
 
 
-def test_check_existing_issue_found(requests_mock):
-    """Tests that an existing issue is found."""
-    title = "New Version Available: my-chart 1.2.3"
-    mock_response = [{"title": title, "number": 123}]
-    requests_mock.get(
-        "https://api.github.com/repos/test-owner/test-repo/issues",
-        json=mock_response,
-    )
-    issue_num = version_checker.check_existing_issue(
-        "test-owner/test-repo", "fake-token", title
-    )
-    assert issue_num == 123
-
-
-def test_check_existing_issue_not_found(requests_mock):
-    """Tests when no matching issue is found."""
-    title = "New Version Available: my-chart 1.2.3"
-    mock_response = [{"title": "Some other issue", "number": 124}]
+@pytest.mark.parametrize(
+    "latest, current, expected",
+    [
+        ("v1.19.1", "v1.18.2", True),
+        ("1.19.1", "v1.18.2", True),
+        ("8.6.2", "8.5.10", True),
+        ("v1.2.3", "1.2.3", False),
+        ("1.2.3", "1.02.3", False),
+        ("1.2.3", "1.3.0-rc.1", False),
+        ("1.2.3", "1.2.3-1", True),
+        ("1.2.3-1", "1.2.3", False),
+        ("1.2.3-rc.10", "1.2.3-rc.9", True),
+        ("1.2.3-rc.1", "1.2.3-1", True),
+        ("1.2.3+build.2", "1.2.3+build.1", False),
+        ("1.10", "1.9", True),
+        ("1.3-rc", "1.2", True),
+        ("1.2.1-1", "1.2", True),
+        ("1.2", "1.3-rc", False),
+        ("1.2", "1.2-1", False),
+        ("1.2-1", "1.2", False),
+        ("1.2.0-1", "1.2", False),
+        ("stable", "latest", True),
+        ("latest", "latest", False),
+    ],
+)
+def test_is_newer_version(latest, current, expected):
+    """Tests semantic version comparison with a string fallback."""
+    assert version_checker.is_newer_version(latest, current) is expected
+
+
+def test_load_open_issue_titles(requests_mock):
+    """Tests that open issues are mapped from title to number."""
     requests_mock.get(
         "https://api.github.com/repos/test-owner/test-repo/issues",
-        json=mock_response,
+        json=[
+            {"title": "New Version Available: my-chart 1.2.3", "number": 123},
+            {"title": "Some other issue", "number": 124},
+        ],
     )
-    issue_num = version_checker.check_existing_issue(
-        "test-owner/test-repo", "fake-token", title
+    open_issues = version_checker.load_open_issue_titles(
+        "test-owner/test-repo", "fake-token"
     )
-    assert issue_num is None
+    assert open_issues == {
+        "New Version Available: my-chart 1.2.3": 123,
+        "Some other issue": 124,
+    }
 
 
-def test_check_existing_issue_pagination(requests_mock):
+def test_load_open_issue_titles_pagination(requests_mock):
     """Tests that the function follows pagination links."""
-    title = "New Version Available: my-chart 1.2.3"
     page1_url = "https://api.github.com/repos/test-owner/test-repo/issues"
     page2_url = "https://api.github.com/repos/test-owner/test-repo/issues?page=2"
 
@@ -224,15 +522,106 @@ def test_check_existing_issue_pagination(requests_mock):
     # Page 2 response
     requests_mock.get(
         page2_url,
-        json=[{"title": title, "number": 123}],
+        json=[{"title": "New Version Available: my-chart 1.2.3", "number": 123}],
         headers={},
     )
 
+    open_issues = version_checker.load_open_issue_titles(
+        "test-owner/test-repo", "fake-token"
+    )
+    assert open_issues == {
+        "Wrong issue": 111,
+        "New Version Available: my-chart 1.2.3": 123,
+    }
+    assert requests_mock.call_count == 2
+
+
+def test_load_open_issue_titles_http_error(requests_mock, capsys):
+    """Tests that None is returned if the issues cannot be listed."""
+    requests_mock.get(
+        "https://api.github.com/repos/test-owner/test-repo/issues",
+        status_code=500,
+    )
+    open_issues = version_checker.load_open_issue_titles(
+        "test-owner/test-repo", "fake-token"
+    )
+    assert open_issues is None
+    captured = capsys.readouterr()
+    assert "Error listing open GitHub issues" in captured.err
+
+
+def test_load_open_issue_titles_invalid_json(requests_mock, capsys):
+    """Tests that None is returned if the response is not valid JSON."""
+    requests_mock.get(
+        "https://api.github.com/repos/test-owner/test-repo/issues",
+        text="<html>Unicorn!</html>",
+    )
+    open_issues = version_checker.load_open_issue_titles(
+        "test-owner/test-repo", "fake-token"
+    )
+    assert open_issues is None
+    captured = capsys.readouterr()
+    assert "Error listing open GitHub issues" in captured.err
+
+
+def test_check_existing_issue_found(requests_mock):
+    """Tests that an existing issue is found."""
+    title = "New Version Available: my-chart 1.2.3"
+    mock_response = {"items": [{"title": title, "number": 123}]}
+    m = requests_mock.get("https://api.github.com/search/issues", json=mock_response)
     issue_num = version_checker.check_existing_issue(
         "test-owner/test-repo", "fake-token", title
     )
     assert issue_num == 123
-    assert requests_mock.call_count == 2
+    assert m.last_request.qs["q"] == [
+        f'repo:test-owner/test-repo is:issue is:open in:title "{title}"'.lower()
+    ]
+
+
+def test_check_existing_issue_not_found(requests_mock):
+    """Tests when the search only returns issues with a similar title."""
+    title = "New Version Available: my-chart 1.2.3"
+    mock_response = {
+        "items": [{"title": "New Version Available: my-chart 1.2.3.1", "number": 124}]
+    }
+    requests_mock.get("https://api.github.com/search/issues", json=mock_response)
+    issue_num = version_checker.check_existing_issue(
+        "test-owner/test-repo", "fake-token", title
+    )
+    assert issue_num is None
+
+
+def test_check_existing_issue_cached(requests_mock):
+    """Tests that each title is only searched for once per run."""
+    title = "New Version Available: my-chart 1.2.3"
+    requests_mock.get(
+        "https://api.github.com/search/issues",
+        json={"items": [{"title": title, "number": 123}]},
+    )
+    for _ in range(2):
+        issue_num = version_checker.check_existing_issue(
+            "test-owner/test-repo", "fake-token", title
+        )
+        assert issue_num == 123
+    assert requests_mock.call_count == 1
+
+
+def test_check_existing_issue_http_error(requests_mock, capsys):
+    """Tests that a failed search is reported and not cached."""
+    title = "New Version Available: my-chart 1.2.3"
+    requests_mock.get(
+        "https://api.github.com/search/issues",
+        status_code=422,
+        text='{"message": "Validation Failed"}',
+    )
+    issue_num = version_checker.check_existing_issue(
+        "test-owner/test-repo", "fake-token", title
+    )
+    assert issue_num is None
+    assert ("test-owner/test-repo", title) not in version_checker._issue_search_cache
+    captured = capsys.readouterr()
+    assert "Error checking for existing GitHub issues" in captured.err
+    assert "Validation Failed" in captured.err
 
 
 def test_create_github_issue(requests_mock):
@@ -248,6 +637,7 @@ def test_create_github_issue(requests_mock):
         ["user1", "user2"],
     )
     assert m.called
+    assert m.last_request.headers["Content-Type"] == "application/json"
     assert m.last_request.json() == {
         "title": "Test Title",
         "body": "Test Body",
@@ -255,6 +645,37 @@ def test_create_github_issue(requests_mock):
     }
 
 
+def test_find_values_files(tmp_path: Path):
+    """Tests that only values.yaml files of app group directories are found."""
+    (tmp_path / "first-apps").mkdir()
+    (tmp_path / "first-apps" / "values.yaml").write_text("")
+    (tmp_path / "second-apps").mkdir()
+    (tmp_path / "second-apps" / "values.yaml").write_text("")
+    (tmp_path / "no-values-apps").mkdir()
+    (tmp_path / "directory-apps" / "values.yaml").mkdir(parents=True)
+    (tmp_path / "values.yaml").write_text("")
+
+    values_files = version_checker.find_values_files(str(tmp_path))
+    assert sorted(values_files) == [
+        tmp_path / "first-apps" / "values.yaml",
+        tmp_path / "second-apps" / "values.yaml",
+    ]
+
+
+def test_find_values_files_missing_directory(tmp_path: Path):
+    """Tests that a missing charts directory yields no files."""
+    assert list(version_checker.find_values_files(str(tmp_path / "missing"))) == []
+
+
+def test_find_values_files_unreadable_directory(tmp_path: Path, monkeypatch, capsys):
+    """Tests that an unreadable charts directory yields no files."""
+    scandir = MagicMock(side_effect=PermissionError(13, "Permission denied"))
+    monkeypatch.setattr(version_checker.os, "scandir", scandir)
+    assert list(version_checker.find_values_files(str(tmp_path))) == []
+    captured = capsys.readouterr()
+    assert "Warning: Could not read charts directory" in captured.err
+
+
 def test_parse_args(monkeypatch):
     """Tests successful argument parsing."""
     monkeypatch.setattr(
@@ -283,29 +704,9 @@ def test_parse_args_missing_token(monkeypatch):
         version_checker.parse_args()
 
 
-@patch("version_checker.create_github_issue")
-@patch("version_checker.check_existing_issue")
-@patch("version_checker.get_latest_helm_version")
-def test_main_full_run(
-    mock_get_version: MagicMock,
-    mock_check_issue: MagicMock,
-    mock_create_issue: MagicMock,
-    fs: FakeFilesystem,
-    monkeypatch: pytest.MonkeyPatch,
-):
-    """
-    Tests the main() function
-
-    This test will:
-    1. Create a new version for 'certManager' and no existing issue.
-       -> EXPECT: create_github_issue is called.
-    2. Create a new version for 'argocd' but an issue already exists.
-       -> EXPECT: create_github_issue is NOT called.
-    3. Fail to find a version for 'invalidChart'.
-       -> EXPECT: No call.
-    4. Fail to find a version for 'dexK8sAuthenticator'.
-       -> EXPECT: No call.
-    """
+@pytest.fixture
+def charts_repo(fs: FakeFilesystem, monkeypatch: pytest.MonkeyPatch) -> FakeFilesystem:
+    """Sets up a fake repository with two app groups and the CLI arguments."""
     fs.create_file("MAINTAINERS.yaml", contents=MAINTAINERS_CONTENT)
     fs.create_file(
         "charts/firsttest-apps/values.yaml", contents=FIRSTTEST_VALUES_CONTENT
@@ -328,35 +729,56 @@ def test_main_full_run(
             "MAINTAINERS.yaml",
         ],
     )
+    monkeypatch.setattr(version_checker, "REPO", "test-owner/test-repo")
+    return fs
 
-    version_checker.REPO = "test-owner/test-repo"
 
-    def get_version_side_effect(repo_url, chart_name):
-        if chart_name == "cert-manager":
-            return "v1.19.1"
-        if chart_name == "argo-cd":
-            return "8.6.2"
-        return None 
-    
-    def check_issue_side_effect(repo, token, title):
-        if "certManager" in title:
-            return None
-        if "argocd" in title:
-            return 123
-        return None
+def get_version_side_effect(repo_url, chart_name):
+    if chart_name == "cert-manager":
+        return "v1.19.1"
+    if chart_name == "argo-cd":
+        return "8.6.2"
+    return None
+
+
+@patch("version_checker.create_github_issue")
+@patch("version_checker.check_existing_issue")
+@patch("version_checker.load_open_issue_titles")
+@patch("version_checker.get_latest_helm_version")
+def test_main_full_run(
+    mock_get_version: MagicMock,
+    mock_load_issues: MagicMock,
+    mock_check_issue: MagicMock,
+    mock_create_issue: MagicMock,
+    charts_repo: FakeFilesystem,
+):
+    """
+    Tests the main() function
 
+    This test will:
+    1. Create a new version for 'certManager' and no existing issue.
+       -> EXPECT: create_github_issue is called.
+    2. Create a new version for 'argocd' but an issue already exists.
+       -> EXPECT: create_github_issue is NOT called.
+    3. Fail to find a version for 'invalidChart'.
+       -> EXPECT: No call.
+    4. Fail to find a version for 'dexK8sAuthenticator'.
+       -> EXPECT: No call.
+    """
     mock_get_version.side_effect = get_version_side_effect
-    mock_check_issue.side_effect = check_issue_side_effect
+    mock_load_issues.return_value = {"New Version Available: argocd 8.6.2": 123}
 
     version_checker.main()
 
+    # 'missingValues' is skipped before any lookup is scheduled
+    assert mock_get_version.call_count == 4
+    # Open issues are listed once up front instead of searched per chart
+    mock_load_issues.assert_called_once_with("test-owner/test-repo", "fake-token")
+    mock_check_issue.assert_not_called()
 
     expected_title_cert = "New Version Available: certManager v1.19.1"
-    mock_check_issue.assert_any_call(
-        "test-owner/test-repo", "fake-token", expected_title_cert
-    )
     mock_create_issue.assert_called_once()
-    
+
     call_args = mock_create_issue.call_args[0]
 
     assert call_args[0] == "test-owner/test-repo"
@@ -365,10 +787,195 @@ def test_main_full_run(
     assert "New version available for **certManager**!" in call_args[3] # This is the partial string check
     assert call_args[4] == ["gh-user2"]
 
-    expected_title_argo = "New Version Available: argocd 8.6.2"
+
+@patch("version_checker.create_github_issue")
+@patch("version_checker.check_existing_issue")
+@patch("version_checker.load_open_issue_titles")
+@patch("version_checker.get_latest_helm_version")
+def test_main_falls_back_to_issue_search(
+    mock_get_version: MagicMock,
+    mock_load_issues: MagicMock,
+    mock_check_issue: MagicMock,
+    mock_create_issue: MagicMock,
+    charts_repo: FakeFilesystem,
+):
+    """Tests that existing issues are searched per title if listing them fails."""
+    mock_get_version.side_effect = get_version_side_effect
+    mock_load_issues.return_value = None
+
+    def check_issue_side_effect(repo, token, title):
+        if "argocd" in title:
+            return 123
+        return None
+
+    mock_check_issue.side_effect = check_issue_side_effect
+
+    version_checker.main()
+
+    mock_check_issue.assert_any_call(
+        "test-owner/test-repo",
+        "fake-token",
+        "New Version Available: certManager v1.19.1",
+    )
     mock_check_issue.assert_any_call(
-        "test-owner/test-repo", "fake-token", expected_title_argo
+        "test-owner/test-repo",
+        "fake-token",
+        "New Version Available: argocd 8.6.2",
     )
-    
     # Assert create_github_issue was ONLY called once (for certManager)
-    assert mock_create_issue.call_count == 1
\ No newline at end of file
+    assert mock_create_issue.call_count == 1
+
+
+@patch("version_checker.create_github_issue")
+@patch("version_checker.load_open_issue_titles")
+@patch("version_checker.get_latest_helm_version")
+def test_main_same_app_in_several_groups(
+    mock_get_version: MagicMock,
+    mock_load_issues: MagicMock,
+    mock_create_issue: MagicMock,
+    charts_repo: FakeFilesystem,
+):
+    """Tests that only one issue is created for an app listed in several groups."""
+    charts_repo.create_file(
+        "charts/thirdtest-apps/values.yaml", contents=FIRSTTEST_VALUES_CONTENT
+    )
+    mock_get_version.side_effect = get_version_side_effect
+    mock_load_issues.return_value = {}
+
+    version_checker.main()
+
+    created_titles = [call.args[2] for call in mock_create_issue.call_args_list]
+    assert sorted(created_titles) == [
+        "New Version Available: argocd 8.6.2",
+        "New Version Available: certManager v1.19.1",
+    ]
+
+
+@patch("version_checker.create_github_issue")
+@patch("version_checker.load_open_issue_titles")
+@patch("version_checker.get_latest_helm_version")
+def test_main_creates_every_queued_issue(
+    mock_get_version: MagicMock,
+    mock_load_issues: MagicMock,
+    mock_create_issue: MagicMock,
+    charts_repo: FakeFilesystem,
+):
+    """Tests that every issue queued in the report loop is created."""
+    mock_get_version.side_effect = get_version_side_effect
+    mock_load_issues.return_value = {}
+
+    version_checker.main()
+
+    created = sorted(call.args for call in mock_create_issue.call_args_list)
+    assert [(args[0], args[1], args[2], args[4]) for args in created] == [
+        (
+            "test-owner/test-repo",
+            "fake-token",
+            "New Version Available: argocd 8.6.2",
+            ["gh-user1"],
+        ),
+        (
+            "test-owner/test-repo",
+            "fake-token",
+            "New Version Available: certManager v1.19.1",
+            ["gh-user2"],
+        ),
+    ]
+    assert "Current `targetRevision` set: `8.5.8`" in created[0][3]
+    assert "charts/secondtest-apps/values.yaml" in created[0][3]
+    assert "Current `targetRevision` set: `v1.18.2`" in created[1][3]
+    assert "charts/firsttest-apps/values.yaml" in created[1][3]
+
+
+@patch("version_checker.create_github_issue")
+@patch("version_checker.load_open_issue_titles")
+@patch("version_checker.get_latest_helm_version")
+def test_main_issue_creation_error_propagates(
+    mock_get_version: MagicMock,
+    mock_load_issues: MagicMock,
+    mock_create_issue: MagicMock,
+    charts_repo: FakeFilesystem,
+):
+    """Tests that an error while creating an issue is not swallowed by the pool."""
+    mock_get_version.side_effect = get_version_side_effect
+    mock_load_issues.return_value = {}
+
+    def create_issue_side_effect(repo, token, title, body, assignees):
+        if "argocd" in title:
+            raise RuntimeError("boom")
+
+    mock_create_issue.side_effect = create_issue_side_effect
+
+    with pytest.raises(RuntimeError, match="boom"):
+        version_checker.main()
+
+    # The other queued issue is still created
+    assert mock_create_issue.call_count == 2
+
+
+@patch("version_checker.create_github_issue")
+@patch("version_checker.load_open_issue_titles")
+def test_main_runs_again_with_fresh_caches(
+    mock_load_issues: MagicMock,
+    mock_create_issue: MagicMock,
+    requests_mock,
+    cert_manager_index,
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+):
+    """Tests that a second main() in the same process sees a changed index."""
+    # The index cache is memory-mapped, which needs real files instead of pyfakefs
+    (tmp_path / "MAINTAINERS.yaml").write_text(MAINTAINERS_CONTENT)
+    (tmp_path / "charts" / "firsttest-apps").mkdir(parents=True)
+    (tmp_path / "charts" / "firsttest-apps" / "values.yaml").write_text(
+        FIRSTTEST_VALUES_CONTENT
+    )
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(
+        sys,
+        "argv",
+        ["script_name", "--token", "fake-token", "--charts-path", "charts"],
+    )
+    monkeypatch.setattr(version_checker, "REPO", "test-owner/test-repo")
+
+    newer_index = cert_manager_index.replace("v1.19.1", "v1.20.0")
+    requests_mock.get(
+        "https://charts.jetstack.io/index.yaml",
+        [
+            {"text": cert_manager_index, "headers": {"ETag": '"first"'}},
+            {"text": newer_index, "headers": {"ETag": '"second"'}},
+        ],
+    )
+    requests_mock.get("https://charts.example.com/index.yaml", status_code=404)
+    mock_load_issues.return_value = {}
+    version_checker._issue_search_cache[("test-owner/test-repo", "stale")] = 1
+
+    version_checker.main()
+    version_checker.main()
+
+    created_titles = [call.args[2] for call in mock_create_issue.call_args_list]
+    assert created_titles == [
+        "New Version Available: certManager v1.19.1",
+        "New Version Available: certManager v1.20.0",
+    ]
+    assert version_checker._issue_search_cache == {}
+
+
+@patch("version_checker.load_open_issue_titles")
+@patch("version_checker.get_latest_helm_version")
+def test_main_no_values_files(
+    mock_get_version: MagicMock,
+    mock_load_issues: MagicMock,
+    charts_repo: FakeFilesystem,
+    monkeypatch: pytest.MonkeyPatch,
+    capsys,
+):
+    """Tests that main() exits early if no values.yaml files are found."""
+    charts_repo.create_dir("empty-charts/some-apps")
+    monkeypatch.setattr(sys, "argv", [*sys.argv[:4], "empty-charts", *sys.argv[5:]])
+
+    version_checker.main()
+
+    mock_get_version.assert_not_called()
+    captured = capsys.readouterr()
+    assert "No 'values.yaml' files found" in captured.out